@@ -1,9 +1,6 @@
-import subprocess
 import sys
 import os
 import ctypes
-import tkinter as tk
-from tkinter import messagebox
 
 # ---------------------------------------------------
 # Auto Elevate to Administrator
@@ -21,12 +18,18 @@ if not is_admin():
     )
     sys.exit()
 
+# Imported only once elevated, so the relaunching process exits quickly
+import subprocess
+import tkinter as tk
+from tkinter import messagebox
+
 # ---------------------------------------------------
 # Run a command
 # ---------------------------------------------------
-def run_command(cmd):
+def run_command(argv):
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(argv, capture_output=True, text=True,
+                                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
         if result.returncode != 0:
             messagebox.showerror("Error", result.stderr.strip())
         return result.stdout
@@ -38,13 +41,13 @@ def run_command(cmd):
 # GPU Clock Modes
 # ---------------------------------------------------
 def set_clock(mhz):
-    run_command(f"nvidia-smi -lgc {mhz},{mhz}")
+    run_command(["nvidia-smi", "-lgc", f"{mhz},{mhz}"])
     messagebox.showinfo("GPU Mode", f"GPU clock locked to {mhz} MHz.")
 
 
 def restore_defaults():
-    run_command("nvidia-smi -rgc")
-    run_command("nvidia-smi -rac")
+    run_command(["nvidia-smi", "-rgc"])
+    run_command(["nvidia-smi", "-rac"])
     messagebox.showinfo("GPU Mode", "GPU clocks restored to default.")
 
 
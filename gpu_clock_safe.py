@@ -17,65 +17,65 @@ import os
 import sys
 import json
 import time
+import bisect
 import threading
+import queue
+import atexit
 import subprocess
+import tempfile
+import shutil
 import ctypes
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from tkinter import ttk
 from pathlib import Path
-from PIL import Image, ImageTk
+from types import SimpleNamespace
+from importlib.util import find_spec
 import logging
-
-# third-party libs
-try:
-    import psutil
-except Exception:
-    psutil = None
-
-try:
-    from pynvml import nvmlInit, nvmlDeviceGetHandleByIndex, nvmlDeviceGetTemperature, nvmlShutdown, NVML_TEMPERATURE_GPU
-    PYNVML_AVAILABLE = True
-    logging.info("pynvml loaded successfully")
-except ImportError:
-    nvmlInit = nvmlDeviceGetHandleByIndex = nvmlDeviceGetTemperature = nvmlShutdown = None
-    NVML_TEMPERATURE_GPU = None
-    PYNVML_AVAILABLE = False
-    logging.warning("pynvml not available - temperature reading via NVML disabled")
-except Exception as e:
-    logging.exception(f"Failed to initialize pynvml: {e}")
-    PYNVML_AVAILABLE = False
-
-try:
-    from win10toast import ToastNotifier
-    TOASTER_AVAILABLE = True
-except Exception:
-    TOASTER_AVAILABLE = False
-
-try:
-    import pystray
-    from pystray import MenuItem as Item, Menu as Menu
-    PYSTRAY_AVAILABLE = True
-except Exception:
-    pystray = None
-    PYSTRAY_AVAILABLE = False
-
-try:
-    import keyboard  # for global hotkeys
-    KEYBOARD_AVAILABLE = True
-except Exception:
-    keyboard = None
-    KEYBOARD_AVAILABLE = False
+import logging.handlers
 
 APP_NAME = "GPU Clock Safe"
 SETTINGS_FILE = Path.home() / ".gpu_clock_safe_settings.json"
 LOG_FILE = Path.home() / "gpu_clock_safe.log"
-
-# Setup logging
-logging.basicConfig(filename=str(LOG_FILE), level=logging.INFO,
-                    format="%(asctime)s [%(levelname)s] %(message)s")
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)  # Windows-only flag
+
+# Setup logging: warnings and errors only, unless GPU_CLOCK_SAFE_DEBUG=1.
+# Configured before any third-party import so their messages land in the log file.
+# Records are queued in memory and written to disk by a QueueListener thread,
+# so callers never block on file I/O.
+LOG_LEVEL = logging.INFO if os.environ.get("GPU_CLOCK_SAFE_DEBUG") == "1" else logging.WARNING
+_log_file_handler = logging.handlers.RotatingFileHandler(
+    str(LOG_FILE), maxBytes=1_000_000, backupCount=2, encoding="utf-8")
+_log_file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+_log_queue = queue.SimpleQueue()
+# not basicConfig: it would give the QueueHandler a formatter and format records twice
+logging.getLogger().setLevel(LOG_LEVEL)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drain queued records on exit
 logger = logging.getLogger(APP_NAME)
 
+# tkinter, psutil and pynvml are imported by _import_runtime_deps() once main()
+# knows the process is elevated, so the non-admin launch that only relaunches
+# itself does not pay for them.
+tk = ttk = filedialog = messagebox = None
+psutil = None
+nvmlInit = nvmlDeviceGetHandleByIndex = nvmlDeviceGetTemperature = nvmlShutdown = None
+NVML_TEMPERATURE_GPU = None
+NVMLError_Uninitialized = NVMLError_NotSupported = None
+nvmlDeviceSetGpuLockedClocks = nvmlDeviceResetGpuLockedClocks = nvmlDeviceResetApplicationsClocks = None
+PYNVML_AVAILABLE = False
+
+# Heavy optional libs (Pillow, pystray, win10toast, keyboard) are imported on
+# first use through the _lazy_* helpers below so the window appears sooner.
+# find_spec only locates the package, it does not import it.
+Image = ImageTk = None
+pystray = Item = Menu = None
+ToastNotifier = None
+keyboard = None
+PIL_AVAILABLE = find_spec("PIL") is not None
+TOASTER_AVAILABLE = find_spec("win10toast") is not None
+PYSTRAY_AVAILABLE = find_spec("pystray") is not None
+KEYBOARD_AVAILABLE = find_spec("keyboard") is not None  # for global hotkeys
+
 # Default settings
 DEFAULT_SETTINGS = {
     "stable_mhz": 1200,
@@ -89,19 +89,117 @@ DEFAULT_SETTINGS = {
     "start_on_boot": False,
     "show_notifications": True,
     "icon_path": None,
-    "hotkeys_enabled": True
+    "hotkeys_enabled": True,
+    "global_hotkeys": False  # system-wide hook via `keyboard`; otherwise only while the window is focused
 }
 
+TEMP_THRESHOLD_KEYS = ("temp_threshold_boost", "temp_threshold_balanced", "temp_threshold_force_normal")
+
 # Global state
 settings = {}
+cfg = SimpleNamespace(**DEFAULT_SETTINGS)  # attribute view of settings, see _rebuild_cfg()
 tray_icon = None
 toaster = None
 stop_event = threading.Event()
 nvml_handle = None
+_nvml_dead = False  # set once an NVML temperature read fails; temp reads then go straight to nvidia-smi
 current_mode = None
+mainapp = None
+_last_applied_mhz = None  # last core clock successfully locked
+_last_applied_ts = 0.0
+CLOCK_REAPPLY_SECS = 30
+_gpu_stats_cache = {"ts": None, "stats": None}
+GPU_STATS_TTL = 1  # seconds; below the fastest auto-temp poll so every poll gets a fresh reading
+GPU_STATS_FAIL_TTL = 15  # seconds; longer than the slowest auto-temp poll, so a failing nvidia-smi is not retried every poll
 elevated = False
+_ac_cache = (0.0, None)  # (monotonic timestamp, on AC)
+AC_CACHE_TTL = 10  # seconds
+_settings_dirty = threading.Event()
+_settings_write_lock = threading.Lock()
+_last_saved_json = None
+SETTINGS_SAVE_DELAY = 0.5  # seconds to coalesce settings writes
+# (boost_cutoff, force_normal) band edges, rebuilt with cfg by _band_edges();
+# _BAND_MODES gives the mode for each index returned by bisect_right over it.
+_band_table = (DEFAULT_SETTINGS["temp_threshold_boost"], DEFAULT_SETTINGS["temp_threshold_force_normal"])
+_BAND_MODES = ("Boost", "Balanced", "Normal")
 notification_queue = []
 notification_lock = threading.Lock()
+notification_ready = threading.Event()
+_last_notification = (0.0, None, None)  # (monotonic timestamp, title, msg)
+NOTIFY_COALESCE_SECS = 2
+_toast_icon_cache = {"src": None, "ico": None}
+
+
+# -------------------------
+# Lazy imports
+# -------------------------
+def _import_runtime_deps():
+    global tk, ttk, filedialog, messagebox, psutil, PYNVML_AVAILABLE
+    global nvmlInit, nvmlDeviceGetHandleByIndex, nvmlDeviceGetTemperature, nvmlShutdown, NVML_TEMPERATURE_GPU
+    global NVMLError_Uninitialized, NVMLError_NotSupported
+    global nvmlDeviceSetGpuLockedClocks, nvmlDeviceResetGpuLockedClocks, nvmlDeviceResetApplicationsClocks
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+    from tkinter import ttk
+
+    try:
+        import psutil
+    except Exception:
+        psutil = None
+
+    try:
+        from pynvml import nvmlInit, nvmlDeviceGetHandleByIndex, nvmlDeviceGetTemperature, nvmlShutdown, NVML_TEMPERATURE_GPU
+        from pynvml import NVMLError_Uninitialized, NVMLError_NotSupported
+        from pynvml import nvmlDeviceSetGpuLockedClocks, nvmlDeviceResetGpuLockedClocks, nvmlDeviceResetApplicationsClocks
+        PYNVML_AVAILABLE = True
+        logger.info("pynvml loaded successfully")
+    except ImportError:
+        PYNVML_AVAILABLE = False
+        logger.warning("pynvml not available - temperature reading via NVML disabled")
+    except Exception as e:
+        logger.exception("Failed to initialize pynvml: %s", e)
+        PYNVML_AVAILABLE = False
+
+def _lazy_pil():
+    global Image, ImageTk, PIL_AVAILABLE
+    if Image is None and PIL_AVAILABLE:
+        try:
+            from PIL import Image, ImageTk
+        except Exception:
+            logger.exception("Failed to import Pillow")
+            PIL_AVAILABLE = False
+    return PIL_AVAILABLE
+
+def _lazy_pystray():
+    global pystray, Item, Menu, PYSTRAY_AVAILABLE
+    if pystray is None and PYSTRAY_AVAILABLE:
+        try:
+            import pystray
+            from pystray import MenuItem as Item, Menu as Menu
+        except Exception:
+            logger.exception("Failed to import pystray")
+            PYSTRAY_AVAILABLE = False
+    return PYSTRAY_AVAILABLE
+
+def _lazy_toaster():
+    global ToastNotifier, TOASTER_AVAILABLE
+    if ToastNotifier is None and TOASTER_AVAILABLE:
+        try:
+            from win10toast import ToastNotifier
+        except Exception:
+            logger.exception("Failed to import win10toast")
+            TOASTER_AVAILABLE = False
+    return TOASTER_AVAILABLE
+
+def _lazy_keyboard():
+    global keyboard, KEYBOARD_AVAILABLE
+    if keyboard is None and KEYBOARD_AVAILABLE:
+        try:
+            import keyboard
+        except Exception:
+            logger.exception("Failed to import keyboard")
+            KEYBOARD_AVAILABLE = False
+    return KEYBOARD_AVAILABLE
 
 
 # -------------------------
@@ -124,38 +222,93 @@ def relaunch_as_admin():
         return False  # We relaunched → exit current process
     except Exception as e:
         logger.exception("Failed to elevate: %s", e)
+        from tkinter import messagebox
         messagebox.showerror("Admin Required", "This app requires administrator privileges.")
         return False
 
 def load_settings():
-    global settings
+    global settings, _last_saved_json
     if SETTINGS_FILE.exists():
         try:
             with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
                 settings = json.load(f)
+            _last_saved_json = json.dumps(settings, indent=2)
         except Exception:
             settings = DEFAULT_SETTINGS.copy()
     else:
         settings = DEFAULT_SETTINGS.copy()
-        save_settings()
+        _flush_settings()
     for k, v in DEFAULT_SETTINGS.items():
         settings.setdefault(k, v)
-    logger.info("Settings loaded: %s", settings)
+    # a hand-edited file may hold non-numeric thresholds; _band_edges() needs numbers
+    for k in TEMP_THRESHOLD_KEYS:
+        v = settings[k]
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            logger.warning("Invalid %s %r in settings, using default %s", k, v, DEFAULT_SETTINGS[k])
+            settings[k] = DEFAULT_SETTINGS[k]
+    _rebuild_cfg()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Settings loaded: %s", json.dumps(settings))
+
+def _rebuild_cfg():
+    """
+    Refresh the attribute view of settings and the derived threshold table
+    read by the hot paths. Called whenever settings are loaded or saved.
+    """
+    global cfg, _band_table
+    cfg = SimpleNamespace(**{**DEFAULT_SETTINGS, **settings})
+    _band_table = _band_edges(cfg.temp_threshold_boost, cfg.temp_threshold_balanced,
+                              cfg.temp_threshold_force_normal)
+
+def _band_edges(t_boost, t_bal, t_force):
+    """
+    Band edges that reproduce the original threshold rules for any input order:
+    temp >= t_force is always Normal, Boost needs temp below both t_boost and
+    t_bal, everything in between is Balanced. The result is sorted by construction.
+    """
+    return (min(t_boost, t_bal, t_force), t_force)
 
 def save_settings():
-    try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
-        logger.info("Settings saved")
-    except Exception as e:
-        logger.exception("Failed to save settings: %s", e)
+    """
+    Mark settings as changed; settings_writer flushes them shortly after,
+    so a burst of toggles results in a single write.
+    """
+    _rebuild_cfg()
+    _settings_dirty.set()
+
+def _flush_settings():
+    global _last_saved_json
+    with _settings_write_lock:
+        try:
+            data = json.dumps(settings, indent=2)
+            if data == _last_saved_json:
+                return
+            tmp = SETTINGS_FILE.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, SETTINGS_FILE)
+            _last_saved_json = data
+            logger.info("Settings saved")
+        except Exception as e:
+            logger.exception("Failed to save settings: %s", e)
+
+def settings_writer():
+    """
+    Background thread that coalesces save_settings() calls.
+    """
+    while not stop_event.is_set():
+        _settings_dirty.wait()
+        # give further changes a moment to accumulate
+        stop_event.wait(SETTINGS_SAVE_DELAY)
+        _settings_dirty.clear()
+        _flush_settings()
 
 def notify(title, msg):
     """
     FIX: Queue notifications and process them serially to avoid
     win10toast threading issues with classAtom attribute.
     """
-    if not settings.get("show_notifications", True):
+    if not cfg.show_notifications:
         logger.info("Notification: %s - %s", title, msg)
         return
     
@@ -163,9 +316,39 @@ def notify(title, msg):
         logger.info("Notification: %s - %s", title, msg)
         return
     
-    # Queue the notification
+    # Queue the notification, dropping repeats of the one just queued
+    global _last_notification
     with notification_lock:
+        now = time.monotonic()
+        last_ts, last_title, last_msg = _last_notification
+        if (title, msg) == (last_title, last_msg) and now - last_ts < NOTIFY_COALESCE_SECS:
+            return
+        _last_notification = (now, title, msg)
         notification_queue.append((title, msg))
+        notification_ready.set()
+
+def _toast_icon_path():
+    """
+    win10toast only accepts .ico files; convert the configured icon once
+    into %TEMP% and reuse that path until the icon setting changes.
+    """
+    src = cfg.icon_path
+    if src == _toast_icon_cache["src"]:
+        return _toast_icon_cache["ico"]
+    ico = None
+    if src and os.path.exists(src):
+        if src.lower().endswith(".ico"):
+            ico = src
+        elif _lazy_pil():
+            try:
+                ico = os.path.join(tempfile.gettempdir(), "gpu_clock_safe_toast.ico")
+                Image.open(src).save(ico, format="ICO", sizes=[(32, 32)])
+            except Exception:
+                logger.exception("Failed to convert notification icon")
+                ico = None
+    _toast_icon_cache["src"] = src
+    _toast_icon_cache["ico"] = ico
+    return ico
 
 def notification_worker():
     """
@@ -174,6 +357,7 @@ def notification_worker():
     """
     global toaster
     logger.info("Notification worker thread started")
+    _toast_icon_path()  # convert the icon before the first toast needs it
     
     while not stop_event.is_set():
         try:
@@ -182,12 +366,16 @@ def notification_worker():
             with notification_lock:
                 if notification_queue:
                     notification = notification_queue.pop(0)
+                else:
+                    notification_ready.clear()
             
             if notification:
                 title, msg = notification
                 try:
                     # Initialize toaster once
                     if toaster is None:
+                        if not _lazy_toaster():
+                            continue
                         toaster = ToastNotifier()
                     
                     # Show toast WITHOUT threaded=True to avoid nested threading
@@ -195,7 +383,7 @@ def notification_worker():
                         title,
                         msg,
                         threaded=False,  # FIX: Don't use threaded mode
-                        icon_path=settings.get("icon_path") or None,
+                        icon_path=_toast_icon_path(),
                         duration=4
                     )
                 except Exception as e:
@@ -203,100 +391,209 @@ def notification_worker():
                     # Reset toaster on error
                     toaster = None
             else:
-                # No notifications, sleep briefly
-                time.sleep(0.2)
+                # No notifications, block until notify() or stop_app() wakes us
+                notification_ready.wait()
                 
         except Exception as e:
             logger.exception(f"Notification worker error: {e}")
-            time.sleep(1)
+            stop_event.wait(1)
     
     logger.info("Notification worker thread exiting")
 
-def run_cmd(cmd):
+def run_cmd(argv):
+    """
+    Run a command given as an argv list, without an intermediate shell
+    and without flashing a console window. Returns the raw output bytes.
+    """
     try:
-        out = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT, text=True)
+        out = subprocess.check_output(argv, stderr=subprocess.STDOUT,
+                                      creationflags=CREATE_NO_WINDOW)
         return out
     except subprocess.CalledProcessError as e:
-        logger.warning("Command failed [%s]: %s", cmd, e.output)
+        logger.warning("Command failed %s: %s", argv, e.output.decode(errors="replace").strip())
         return None
     except FileNotFoundError:
-        logger.warning("Command not found: %s", cmd)
+        logger.warning("Command not found: %s", argv)
         return None
 
+def nvidia_smi_available():
+    """
+    Whether nvidia-smi is on PATH, checked without running it. A missing or
+    broken GPU shows up as a failed (and briefly cached) query_gpu_stats().
+    """
+    return shutil.which("nvidia-smi") is not None
+
+def _nvml_usable():
+    # Not gated on _nvml_dead: a failed temperature read says nothing about the
+    # clock APIs, and each clock call falls back to nvidia-smi on its own error.
+    return PYNVML_AVAILABLE and nvml_handle is not None
+
+def _remember_applied(core_mhz):
+    global _last_applied_mhz, _last_applied_ts
+    _last_applied_mhz = core_mhz
+    _last_applied_ts = time.monotonic()
+
 def set_gpu_clock(core_mhz):
-    cmd = f'nvidia-smi -lgc {core_mhz},{core_mhz}'
-    out = run_cmd(cmd)
+    # Skip re-locking a clock that was applied moments ago (repeated clicks/hotkeys)
+    if core_mhz == _last_applied_mhz and time.monotonic() - _last_applied_ts < CLOCK_REAPPLY_SECS:
+        return True
+    if _nvml_usable():
+        try:
+            nvmlDeviceSetGpuLockedClocks(nvml_handle, core_mhz, core_mhz)
+            _remember_applied(core_mhz)
+            logger.info("Set GPU clock to %d MHz", core_mhz)
+            return True
+        except Exception:
+            logger.exception("NVML clock lock failed, falling back to nvidia-smi")
+    out = run_cmd(["nvidia-smi", "-lgc", f"{core_mhz},{core_mhz}"])
     if out is None:
         notify("GPUClockSafe", f"Failed to set clock to {core_mhz} MHz")
         return False
+    _remember_applied(core_mhz)
     logger.info("Set GPU clock to %d MHz", core_mhz)
     return True
 
 def restore_gpu_defaults():
-    run_cmd("nvidia-smi -rgc")
-    run_cmd("nvidia-smi -rac")
+    global _last_applied_mhz
+    _last_applied_mhz = None
+    gpu_reset = app_reset = False
+    if _nvml_usable():
+        try:
+            nvmlDeviceResetGpuLockedClocks(nvml_handle)
+            gpu_reset = True
+        except Exception:
+            logger.exception("NVML locked clock reset failed, falling back to nvidia-smi")
+        try:
+            nvmlDeviceResetApplicationsClocks(nvml_handle)
+            app_reset = True
+        except NVMLError_NotSupported:
+            app_reset = True  # common on GeForce: no application clocks to reset
+        except Exception:
+            logger.exception("NVML application clock reset failed, falling back to nvidia-smi")
+    if not gpu_reset:
+        run_cmd(["nvidia-smi", "-rgc"])
+    if not app_reset:
+        run_cmd(["nvidia-smi", "-rac"])
     logger.info("Restored GPU clock defaults")
     notify("GPUClockSafe", "GPU clocks restored to defaults")
 
+def _nvml_reinit():
+    global nvml_handle
+    nvmlInit()
+    nvml_handle = nvmlDeviceGetHandleByIndex(0)
+
 def get_gpu_temp():
-    if PYNVML_AVAILABLE:
+    """
+    Read the GPU temperature through the cached NVML handle.
+    nvidia-smi is only used once NVML is known to be unusable.
+    """
+    global _nvml_dead
+    if PYNVML_AVAILABLE and not _nvml_dead:
         try:
             if nvml_handle is None:
-                nvmlInit()
-            handle = nvmlDeviceGetHandleByIndex(0)
-            temp = nvmlDeviceGetTemperature(handle, NVML_TEMPERATURE_GPU)
-            return int(temp)
+                _nvml_reinit()
+            try:
+                return int(nvmlDeviceGetTemperature(nvml_handle, NVML_TEMPERATURE_GPU))
+            except NVMLError_Uninitialized:
+                _nvml_reinit()
+                return int(nvmlDeviceGetTemperature(nvml_handle, NVML_TEMPERATURE_GPU))
         except Exception:
-            logger.exception("pynvml read failed")
-    out = run_cmd('nvidia-smi --query-gpu=temperature.gpu --format=csv,noheader,nounits')
+            logger.exception("pynvml read failed, falling back to nvidia-smi")
+            _nvml_dead = True
+    stats = query_gpu_stats()
+    return stats["temp"] if stats else None
+
+GPU_STATS_FIELDS = ("temp", "vram_total_mib", "core_mhz", "mem_mhz")
+
+def _parse_stat(field):
+    try:
+        return int(field.strip())
+    except ValueError:
+        return None  # "[N/A]", "[Not Supported]", ...
+
+def query_gpu_stats():
+    """
+    Fetch temperature, VRAM and clocks with a single nvidia-smi call.
+    Fields nvidia-smi cannot report (e.g. "[N/A]") are None. A result is
+    cached for GPU_STATS_TTL seconds, a failed query for GPU_STATS_FAIL_TTL.
+    """
+    now = time.monotonic()
+    if _gpu_stats_cache["ts"] is not None:
+        ttl = GPU_STATS_TTL if _gpu_stats_cache["stats"] is not None else GPU_STATS_FAIL_TTL
+        if now - _gpu_stats_cache["ts"] < ttl:
+            return _gpu_stats_cache["stats"]
+    out = run_cmd(["nvidia-smi", "--query-gpu=temperature.gpu,memory.total,clocks.gr,clocks.mem",
+                   "--format=csv,noheader,nounits"])
+    stats = None
     if out:
-        try:
-            return int(out.strip().splitlines()[0].strip())
-        except Exception:
-            logger.exception("nvidia-smi parsing failed")
-    return None
+        line = out.strip().split(b"\n", 1)[0].decode("ascii", "ignore")
+        fields = [_parse_stat(v) for v in line.split(",")]
+        if len(fields) == len(GPU_STATS_FIELDS):
+            stats = dict(zip(GPU_STATS_FIELDS, fields))
+        else:
+            logger.warning("Unexpected nvidia-smi output: %r", line)
+    _gpu_stats_cache["ts"] = now
+    _gpu_stats_cache["stats"] = stats
+    return stats
 
-def is_on_ac_power():
+def is_on_ac_power(fresh=False):
+    """
+    Whether the machine is on AC power. The auto-temp loop uses a result cached
+    for AC_CACHE_TTL seconds; fresh=True bypasses it for user-initiated checks.
+    """
+    global _ac_cache
+    now = time.monotonic()
+    ts, value = _ac_cache
+    if not fresh and value is not None and now - ts < AC_CACHE_TTL:
+        return value
     if psutil is None:
-        return True
-    bat = psutil.sensors_battery()
-    if bat is None:
-        return True
-    return bool(bat.power_plugged)
+        value = True
+    else:
+        bat = psutil.sensors_battery()
+        value = True if bat is None else bool(bat.power_plugged)
+    _ac_cache = (now, value)
+    return value
 
-def set_mode_normal():
+def _set_current_mode(mode):
+    """
+    Record the active mode and refresh the window label and tray check marks
+    on the Tk thread; callers may be the auto-temp or hotkey threads.
+    """
     global current_mode
-    mhz = settings.get("battery_mhz", DEFAULT_SETTINGS["battery_mhz"])
+    current_mode = mode
+    if mainapp is not None:
+        mainapp.root.after(0, mainapp.update_mode_label)
+
+def set_mode_normal():
+    mhz = cfg.battery_mhz
     ok = set_gpu_clock(mhz)
     if ok:
-        current_mode = "Normal"
+        _set_current_mode("Normal")
         notify(APP_NAME, f"Switched to Normal mode ({mhz} MHz)")
     return ok
 
 def set_mode_balanced():
-    global current_mode
-    mhz = settings.get("stable_mhz", DEFAULT_SETTINGS["stable_mhz"])
+    mhz = cfg.stable_mhz
     ok = set_gpu_clock(mhz)
     if ok:
-        current_mode = "Balanced"
+        _set_current_mode("Balanced")
         notify(APP_NAME, f"Switched to Balanced mode ({mhz} MHz)")
     return ok
 
 def set_mode_boost(force=False):
-    global current_mode
-    if not force and not is_on_ac_power():
+    if not force and not is_on_ac_power(fresh=True):
         notify(APP_NAME, "Boost mode blocked: running on battery")
         return False
     temp = get_gpu_temp()
     if temp is not None:
-        thr = settings.get("temp_threshold_boost", DEFAULT_SETTINGS["temp_threshold_boost"])
+        thr = cfg.temp_threshold_boost
         if temp >= thr:
             notify(APP_NAME, f"Boost blocked: GPU temp {temp}°C >= {thr}°C")
             return False
-    mhz = settings.get("boost_mhz", DEFAULT_SETTINGS["boost_mhz"])
+    mhz = cfg.boost_mhz
     ok = set_gpu_clock(mhz)
     if ok:
-        current_mode = "Boost"
+        _set_current_mode("Boost")
         notify(APP_NAME, f"Switched to Boost mode ({mhz} MHz)")
     return ok
 
@@ -304,39 +601,40 @@ def set_mode_boost(force=False):
 # -------------------------
 # Auto-temp thread
 # -------------------------
+AUTO_TEMP_POLL = 5          # seconds, default poll interval
+AUTO_TEMP_POLL_STABLE = 10  # seconds, temp well inside the Balanced band
+AUTO_TEMP_POLL_NEAR = 2     # seconds, temp close to a threshold
+AUTO_TEMP_NEAR_MARGIN = 3   # °C
+
 def auto_temp_loop():
     logger.info("Auto-temp thread started")
     while not stop_event.is_set():
+        interval = AUTO_TEMP_POLL
         try:
-            if settings.get("auto_temp_mode", False):
+            if cfg.auto_temp_mode:
                 temp = get_gpu_temp()
-                if temp is None:
-                    # cannot read temp, skip
-                    time.sleep(5)
-                    continue
-                t_boost = settings.get("temp_threshold_boost", 70)
-                t_bal = settings.get("temp_threshold_balanced", 80)
-                t_force = settings.get("temp_threshold_force_normal", 85)
-                ac = is_on_ac_power()
-                # Logic: highest priority: forced normal if > force threshold
-                if temp >= t_force:
-                    if current_mode != "Normal":
-                        set_mode_normal()
-                elif temp >= t_bal:
-                    if current_mode != "Balanced":
-                        set_mode_balanced()
-                else:
-                    # temp < t_boost, and only allow boost if AC
-                    if ac and temp < t_boost:
-                        if current_mode != "Boost":
+                if temp is not None:
+                    thresholds = _band_table
+                    band = _BAND_MODES[bisect.bisect_right(thresholds, temp)]
+                    # Boost is only allowed on AC power
+                    if band == "Boost" and not is_on_ac_power():
+                        band = "Balanced"
+                    # Only touch the clocks when the band differs from the active mode
+                    if band != current_mode:
+                        if band == "Normal":
+                            set_mode_normal()
+                        elif band == "Boost":
                             set_mode_boost(force=True)
-                    else:
-                        if current_mode != "Balanced":
+                        else:
                             set_mode_balanced()
-            time.sleep(5)
+                    if min(abs(temp - t) for t in thresholds) <= AUTO_TEMP_NEAR_MARGIN:
+                        interval = AUTO_TEMP_POLL_NEAR
+                    elif thresholds[0] <= temp < thresholds[1]:
+                        interval = AUTO_TEMP_POLL_STABLE
         except Exception:
             logger.exception("Auto-temp loop exception")
-            time.sleep(5)
+        if stop_event.wait(interval):
+            break
     logger.info("Auto-temp thread exiting")
 
 
@@ -344,7 +642,7 @@ def auto_temp_loop():
 # Hotkeys
 # -------------------------
 def hotkey_worker():
-    if not KEYBOARD_AVAILABLE:
+    if not _lazy_keyboard():
         logger.info("Global hotkeys not available (keyboard module missing)")
         return
     logger.info("Hotkey thread starting")
@@ -359,8 +657,7 @@ def hotkey_worker():
             keyboard.add_hotkey('ctrl+alt+3', lambda: set_mode_boost())
             logger.info("Hotkeys registered")
             # block until stop_event is set
-            while not stop_event.is_set():
-                time.sleep(0.1)
+            stop_event.wait()
             keyboard.unhook_all_hotkeys()
     except Exception:
         logger.exception("Hotkey worker failed")
@@ -377,10 +674,14 @@ class MainApp:
         self.root.protocol("WM_DELETE_WINDOW", self.hide_window)
         self.root.geometry("520x340")
         self.icon_image = None
-        self.setup_ui()
+        self._preview_key = None     # (path, mtime) of icon_image
+        self._tray_image = None
+        self._tray_image_key = None  # (path, mtime) of _tray_image
         self.tray_thread = None
         self.tray_icon = None
         self.tray_running = False
+        self.setup_ui()
+        self.bind_hotkeys()
 
     def setup_ui(self):
         menubar = tk.Menu(self.root)
@@ -434,15 +735,30 @@ class MainApp:
 
         ttk.Button(frm, text="Open log file", command=lambda: os.startfile(LOG_FILE)).pack(side="bottom", pady=6)
 
+    def bind_hotkeys(self):
+        # Window-level hotkeys need no global keyboard hook; hotkey_worker
+        # installs system-wide ones instead when global_hotkeys is enabled.
+        if not cfg.hotkeys_enabled or cfg.global_hotkeys:
+            return
+        self.root.bind_all('<Control-Alt-Key-1>', lambda e: self.on_normal())
+        self.root.bind_all('<Control-Alt-Key-2>', lambda e: self.on_balanced())
+        self.root.bind_all('<Control-Alt-Key-3>', lambda e: self.on_boost())
+
     def update_mode_label(self):
         self.mode_var.set(f"Mode: {current_mode or 'Unknown'}")
+        if self.tray_running:
+            # the win32 backend caches the native menu; refresh its check marks
+            self.tray_icon.update_menu()
 
     def load_icon_preview(self):
         p = settings.get("icon_path")
-        if p and os.path.exists(p):
+        if p and os.path.exists(p) and _lazy_pil():
             try:
-                img = Image.open(p).resize((32, 32), Image.LANCZOS)
-                self.icon_image = ImageTk.PhotoImage(img)
+                key = (p, os.stat(p).st_mtime)
+                if key != self._preview_key:
+                    img = Image.open(p).resize((32, 32), Image.LANCZOS)
+                    self.icon_image = ImageTk.PhotoImage(img)
+                    self._preview_key = key
                 self.icon_label.config(image=self.icon_image)
             except Exception:
                 self.icon_label.config(text="(invalid icon)")
@@ -505,19 +821,13 @@ class MainApp:
             self._update_tray_icon(p)
 
     def on_normal(self):
-        ok = set_mode_normal()
-        self.update_mode_label()
-        return ok
+        return set_mode_normal()
 
     def on_balanced(self):
-        ok = set_mode_balanced()
-        self.update_mode_label()
-        return ok
+        return set_mode_balanced()
 
     def on_boost(self):
-        ok = set_mode_boost()
-        self.update_mode_label()
-        return ok
+        return set_mode_boost()
 
     def on_toggle_auto_temp(self):
         settings["auto_temp_mode"] = bool(self.auto_temp_var.get())
@@ -552,14 +862,19 @@ class MainApp:
         ip = settings.get("icon_path")
         if ip and os.path.exists(ip):
             try:
-                img = Image.open(ip)
-                # pystray wants PIL.Image
-                return img
+                key = (ip, os.stat(ip).st_mtime)
+                if key != self._tray_image_key:
+                    # pystray wants PIL.Image
+                    self._tray_image = Image.open(ip)
+                    self._tray_image_key = key
+                return self._tray_image
             except Exception:
                 logger.exception("Invalid icon image")
         # fallback: create a small icon
-        img = Image.new('RGBA', (64, 64), (40, 40, 40, 255))
-        return img
+        if self._tray_image_key != "fallback":
+            self._tray_image = Image.new('RGBA', (64, 64), (40, 40, 40, 255))
+            self._tray_image_key = "fallback"
+        return self._tray_image
 
     def _update_tray_icon(self, new_path):
         if not PYSTRAY_AVAILABLE or self.tray_icon is None:
@@ -570,7 +885,7 @@ class MainApp:
             logger.exception("Failed to update tray icon")
 
     def create_tray(self):
-        if not PYSTRAY_AVAILABLE:
+        if not _lazy_pystray() or not _lazy_pil():
             return
 
         def safe_call(func):
@@ -583,9 +898,11 @@ class MainApp:
 
         menu = Menu(
             Item('Open GPU Clock Safe', safe_call(self.show_window)),
-            Item('Normal Mode', safe_call(self.on_normal)),
-            Item('Balanced Mode', safe_call(self.on_balanced)),
-            Item('Boost Mode', safe_call(self.on_boost)),
+            # checked is evaluated by pystray when the menu is shown,
+            # so the menu is built once and never rebuilt on mode changes
+            Item('Normal Mode', safe_call(self.on_normal), checked=lambda item: current_mode == "Normal", radio=True),
+            Item('Balanced Mode', safe_call(self.on_balanced), checked=lambda item: current_mode == "Balanced", radio=True),
+            Item('Boost Mode', safe_call(self.on_boost), checked=lambda item: current_mode == "Boost", radio=True),
             Item(Menu.SEPARATOR, dummy),
             Item('Settings', safe_call(self.show_window)),
             Item('Exit & Restore Clocks', safe_call(self.exit_and_restore)),
@@ -658,6 +975,10 @@ def set_startup(enable):
 def stop_app():
     logger.info("Stopping app")
     stop_event.set()
+    notification_ready.set()
+    if _settings_dirty.is_set():
+        _settings_dirty.clear()
+        _flush_settings()
     try:
         restore_gpu_defaults()
     except Exception:
@@ -716,6 +1037,7 @@ def main():
             return
 
     elevated = True
+    _import_runtime_deps()
     load_settings()
 
     if PYNVML_AVAILABLE:
@@ -725,14 +1047,20 @@ def main():
         except Exception:
             logger.exception("NVML initialization failed")
 
+    if nvml_handle is None and not nvidia_smi_available():
+        logger.warning("Neither NVML nor nvidia-smi available - clock control will not work")
+
     root = tk.Tk()
     mainapp = MainApp(root)
 
     if PYSTRAY_AVAILABLE:
-        mainapp.create_tray()
+        # build the tray once the window has been drawn
+        root.after_idle(mainapp.create_tray)
 
+    threading.Thread(target=settings_writer, daemon=True).start()
     threading.Thread(target=auto_temp_loop, daemon=True).start()
-    threading.Thread(target=hotkey_worker, daemon=True).start()
+    if cfg.hotkeys_enabled and cfg.global_hotkeys:
+        threading.Thread(target=hotkey_worker, daemon=True).start()
     
     # FIX: Start notification worker thread
     if TOASTER_AVAILABLE: